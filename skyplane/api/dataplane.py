@@ -224,11 +224,11 @@ class Dataplane:
         try:
             do_parallel(lambda fn: fn(), jobs, n=-1, spinner=spinner, spinner_persist=spinner, desc="Starting gateway container on VMs")
         except Exception as e:
-            self.copy_gateway_logs()
+            self.copy_gateway_logs(max_jobs=max_jobs)
             raise GatewayContainerStartException(f"Error starting gateways. Please check gateway logs {self.transfer_dir}")
 
-    def copy_gateway_logs(self):
-        # copy logs from all gateways in parallel
+    def copy_gateway_logs(self, max_jobs: int = 16):
+        # copy logs from all gateways in parallel, at most max_jobs ssh sessions at once
         def copy_log(instance):
             out_file = self.transfer_dir / f"gateway_{instance.uuid()}.stdout"
             err_file = self.transfer_dir / f"gateway_{instance.uuid()}.stderr"
@@ -237,7 +237,7 @@ class Dataplane:
             instance.download_file("/tmp/gateway.stdout", out_file)
             instance.download_file("/tmp/gateway.stderr", err_file)
 
-        do_parallel(copy_log, self.bound_nodes.values(), n=-1)
+        do_parallel(copy_log, self.bound_nodes.values(), n=max_jobs)
 
     def deprovision(self, max_jobs: int = 64, spinner: bool = False):
         """
@@ -251,7 +251,7 @@ class Dataplane:
         with self.provisioning_lock:
             if self.debug and self.provisioned:
                 logger.fs.info(f"Copying gateway logs to {self.transfer_dir}")
-                self.copy_gateway_logs()
+                self.copy_gateway_logs(max_jobs=max_jobs)
 
             if not self.provisioned:
                 logger.fs.warning("Attempting to deprovision dataplane that is not provisioned, this may be from auto_deprovision.")
@@ -1,4 +1,6 @@
 import socket
+import ssl
+import struct
 from dataclasses import asdict, dataclass
 from enum import Enum, auto
 from functools import total_ordering
@@ -92,6 +94,10 @@ class ChunkState(Enum):
         return self.value < other.value
 
 
+# magic, protocol_version, chunk_id, data_len, raw_data_len, is_compressed, n_chunks_left_on_socket (network byte order, unpadded)
+_WIRE_HEADER_STRUCT = struct.Struct("!QI16sQQ?Q")
+
+
 @dataclass
 class WireProtocolHeader:
     """Lightweight wire protocol header for chunk transfers along socket."""
@@ -116,24 +122,18 @@ class WireProtocolHeader:
     @staticmethod
     def length_bytes():
         # magic (8) + protocol_version (4) + chunk_id (16) + data_len (8) + raw_data_len(8) + is_compressed (1) + n_chunks_left_on_socket (8)
-        return 8 + 4 + 16 + 8 + 8 + 1 + 8
+        return _WIRE_HEADER_STRUCT.size
 
     @staticmethod
     def from_bytes(data: bytes):
         assert len(data) == WireProtocolHeader.length_bytes(), f"{len(data)} != {WireProtocolHeader.length_bytes()}"
-        magic = int.from_bytes(data[:8], byteorder="big")
+        magic, version, chunk_id, chunk_len, raw_chunk_len, is_compressed, n_chunks_left_on_socket = _WIRE_HEADER_STRUCT.unpack_from(data)
         if magic != WireProtocolHeader.magic_hex():
             raise ValueError(f"Invalid magic number, got {magic:x} but expected {WireProtocolHeader.magic_hex():x}")
-        version = int.from_bytes(data[8:12], byteorder="big")
         if version != WireProtocolHeader.protocol_version():
             raise ValueError(f"Invalid protocol version, got {version} but expected {WireProtocolHeader.protocol_version()}")
-        chunk_id = data[12:28].hex()
-        chunk_len = int.from_bytes(data[28:36], byteorder="big")
-        raw_chunk_len = int.from_bytes(data[36:44], byteorder="big")
-        is_compressed = bool(int.from_bytes(data[44:45], byteorder="big"))
-        n_chunks_left_on_socket = int.from_bytes(data[45:53], byteorder="big")
         return WireProtocolHeader(
-            chunk_id=chunk_id,
+            chunk_id=chunk_id.hex(),
             data_len=chunk_len,
             raw_data_len=raw_chunk_len,
             is_compressed=is_compressed,
@@ -141,26 +141,31 @@ class WireProtocolHeader:
         )
 
     def to_bytes(self):
-        out_bytes = b""
-        out_bytes += self.magic_hex().to_bytes(8, byteorder="big")
-        out_bytes += self.protocol_version().to_bytes(4, byteorder="big")
         chunk_id_bytes = bytes.fromhex(self.chunk_id)
         assert len(chunk_id_bytes) == 16
-        out_bytes += chunk_id_bytes
-        out_bytes += self.data_len.to_bytes(8, byteorder="big")
-        out_bytes += self.raw_data_len.to_bytes(8, byteorder="big")
-        out_bytes += self.is_compressed.to_bytes(1, byteorder="big")
-        out_bytes += self.n_chunks_left_on_socket.to_bytes(8, byteorder="big")
-        assert len(out_bytes) == WireProtocolHeader.length_bytes(), f"{len(out_bytes)} != {WireProtocolHeader.length_bytes()}"
-        return out_bytes
+        return _WIRE_HEADER_STRUCT.pack(
+            self.magic_hex(),
+            self.protocol_version(),
+            chunk_id_bytes,
+            self.data_len,
+            self.raw_data_len,
+            self.is_compressed,
+            self.n_chunks_left_on_socket,
+        )
 
     @staticmethod
     def from_socket(sock: socket.socket):
         num_bytes = WireProtocolHeader.length_bytes()
-        header_bytes = b""
-        while len(header_bytes) < num_bytes:
-            header_bytes += sock.recv(num_bytes - len(header_bytes))
-        assert len(header_bytes) == num_bytes, f"{len(header_bytes)} != {num_bytes}"
+        header_bytes = bytearray(num_bytes)
+        # a buffered sock.makefile() reader would swallow the start of the chunk body, which the receiver reads from the raw
+        # socket, so read exactly the header: in one MSG_WAITALL syscall on plaintext sockets (SSL sockets reject recv flags)
+        flags = 0 if isinstance(sock, ssl.SSLSocket) else socket.MSG_WAITALL
+        view = memoryview(header_bytes)
+        while view:
+            n = sock.recv_into(view, len(view), flags)
+            if n == 0:
+                raise ConnectionError(f"Socket closed after receiving {num_bytes - len(view)} of {num_bytes} header bytes")
+            view = view[n:]
         return WireProtocolHeader.from_bytes(header_bytes)
 
     def to_socket(self, sock: socket.socket):
@@ -380,16 +380,7 @@ def load_ibmcloud_config(config: SkyplaneConfig, force_init: bool = False, non_i
         CONFIG_DIR = os.path.join(HOME_DIR, ".bluemix")
         CONFIG_FILE = os.path.join(CONFIG_DIR, "ibm_credentials")
 
-        def load_yaml_config(config_filename):
-            import yaml
-
-            try:
-                with open(config_filename, "r") as config_file:
-                    data = yaml.safe_load(config_file)
-            except FileNotFoundError:
-                data = {}
-
-            return data
+        from skyplane.compute.ibmcloud.ibm_gen2.utils import load_yaml_config
 
         def get_default_config_filename():
             """
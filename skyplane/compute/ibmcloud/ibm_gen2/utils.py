@@ -7,12 +7,20 @@ Created on 21 Feb 2023
 import os
 
 
+def _yaml_loader_dumper():
+    """Prefer the libyaml-backed C loader/dumper, which emit the same YAML several times faster than the pure Python ones"""
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader), getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
 def load_yaml_config(config_filename):
     import yaml
 
+    loader, _ = _yaml_loader_dumper()
     try:
         with open(config_filename, "r") as config_file:
-            data = yaml.safe_load(config_file)
+            data = yaml.load(config_file, Loader=loader)
     except FileNotFoundError:
         data = {}
 
@@ -22,11 +30,15 @@ def load_yaml_config(config_filename):
 def dump_yaml_config(config_filename, data):
     import yaml
 
+    _, dumper = _yaml_loader_dumper()
     if not os.path.exists(os.path.dirname(config_filename)):
         os.makedirs(os.path.dirname(config_filename))
 
-    with open(config_filename, "w") as config_file:
-        yaml.dump(data, config_file, default_flow_style=False)
+    # write to a temporary file and rename it over the cache so readers never see a partially written file
+    tmp_filename = f"{config_filename}.tmp.{os.getpid()}"
+    with open(tmp_filename, "w") as config_file:
+        yaml.dump(data, config_file, Dumper=dumper, default_flow_style=False)
+    os.replace(tmp_filename, config_filename)
 
 
 def delete_yaml_config(config_filename):
@@ -20,11 +20,15 @@ import inspect
 import re
 import os
 import paramiko
+import requests
 import time
 import logging
 import uuid
 import random
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import parse_qs, urlparse
 
 from skyplane.compute.ibmcloud.ibm_gen2.ssh_client import SSHClient
 from skyplane.compute.ibmcloud.ibm_gen2.constants import COMPUTE_CLI_MSG, CACHE_DIR
@@ -35,7 +39,71 @@ from skyplane.utils import imports
 logger = logging.getLogger(__name__)
 
 INSTANCE_START_TIMEOUT = 180 * 2
+INSTANCE_DELETE_TIMEOUT = 60 * 10
+INSTANCE_DATA_TTL = 2  # seconds a fetched instance record is reused before get_instance_data hits the API again
 VPC_API_VERSION = "2021-09-21"
+VSI_NAME_PREFIX = "skyplane-ibm"
+FIP_NAME_PREFIX = "skyplane-"
+VPC_NAME_RE = re.compile(r"^[a-z0-9:-]*$")
+
+# a key's public key never changes, and every gateway VSI in a deployment shares the same ssh key, so fetch each only once.
+# clean(all=True) deletes the key and the next deployment creates a new one, so only the most recently used ids are kept
+PUBLIC_KEYS_BY_ID = OrderedDict()
+PUBLIC_KEYS_MAX_ENTRIES = 64
+PUBLIC_KEYS_LOCK = threading.Lock()
+
+# floating IP deletes from every VSI being torn down share one bounded pool, instead of each delete() starting its own
+# threads and a large teardown firing all of them at the API at once
+FIP_DELETE_EXECUTOR = ThreadPoolExecutor(8, thread_name_prefix="ibm-fip-delete")
+
+# requests keeps 10 connections per host by default, fewer than the backend executor's threads; connections beyond
+# the pool are closed after each call, so the next call from that thread pays a new TLS handshake
+HTTP_POOL_MAXSIZE = 32
+
+
+def iter_paginated(list_fn, key, **kwargs):
+    """
+    Yields the items of a paginated VPC list call (e.g. list_instances, "instances"), 100 per page.
+    Further pages are only fetched as the caller consumes items, so a search can stop early
+    """
+    result = list_fn(limit=100, **kwargs).get_result()
+    while True:
+        yield from result[key]
+        if "next" not in result:
+            return
+        start = parse_qs(urlparse(result["next"]["href"]).query)["start"][0]
+        result = list_fn(start=start, limit=100, **kwargs).get_result()
+
+
+def enlarge_http_pool(vpc_cli):
+    """
+    Remounts the client's requests session with a connection pool sized for the backend's concurrency
+    """
+    adapter = getattr(vpc_cli, "http_adapter", None)
+    if adapter is not None:  # keep the SDK's own adapter, it pins the TLS settings
+        adapter = type(adapter)(
+            pool_connections=HTTP_POOL_MAXSIZE, pool_maxsize=HTTP_POOL_MAXSIZE, _disable_ssl_verification=vpc_cli.disable_ssl_verification
+        )
+        vpc_cli.http_adapter = adapter
+    else:
+        adapter = requests.adapters.HTTPAdapter(pool_connections=HTTP_POOL_MAXSIZE, pool_maxsize=HTTP_POOL_MAXSIZE)
+    vpc_cli.http_client.mount("https://", adapter)
+    vpc_cli.http_client.mount("http://", adapter)
+
+
+def wait_with_backoff(is_done, timeout, initial_sleep=0.25, max_sleep=10, jitter=0.1):
+    """
+    Polls is_done() until it returns True, sleeping with exponential backoff plus jitter between attempts.
+    Returns False if timeout seconds elapse first
+    """
+    start = time.time()
+    sleep_time = initial_sleep
+    while not is_done():
+        if time.time() - start >= timeout:
+            return False
+        time.sleep(sleep_time + random.uniform(0, jitter))
+        sleep_time = min(sleep_time * 2, max_sleep)
+    return True
 
 
 class IBMVPCBackend:
@@ -46,6 +114,7 @@ class IBMVPCBackend:
 
         self.vpc_name = None
         self.vpc_data = None
+        self.vpc_data_on_disk = None  # last contents read from or written to vpc_data_filename
         self.vpc_key = None
 
         self.endpoint = self.config["endpoint"]
@@ -54,9 +123,18 @@ class IBMVPCBackend:
         self.vpc_data_filename = os.path.join(self.cache_dir, self.region + "_data")
         self.custom_image = self.config.get("custom_skyplane_image")
 
+        # resource names derived from the host, computed once rather than on every create/delete
+        self.ssh_key_name = f"skyplane-key-{str(uuid.getnode())[-6:]}"
+        self.ssh_key_filename = os.path.expanduser(os.path.join("~", ".ssh", f"{self.ssh_key_name}.id_rsa"))
+
         logger.debug(f"Setting VPC endpoint to: {self.endpoint}")
 
         self.workers = []
+        self.workers_lock = threading.Lock()  # guards only the list swap/append, never held across VPC API calls
+        self.provisioning_semaphore = threading.BoundedSemaphore(8)
+        # shared by all teardown fan-outs, so repeated calls reuse threads and stay within the VPC API rate limit
+        self.executor = ThreadPoolExecutor(16, thread_name_prefix="ibm-vpc")
+        self.prototype_template = None  # instance prototype fields shared by every VSI, built on first use
 
         self.iam_api_key = self.config.get("iam_api_key")
         self.vpc_cli = self.create_vpc_cli()
@@ -75,16 +153,25 @@ class IBMVPCBackend:
 
     @imports.inject("ibm_vpc", "ibm_cloud_sdk_core", pip_extra="ibmcloud")
     def create_vpc_cli(ibm_vpc, ibm_cloud_sdk_core, self):
-        authenticator = ibm_cloud_sdk_core.authenticators(self.iam_api_key, url=self.config.get("iam_endpoint"))
-        vpc_cli = ibm_vpc.VpcV1(VPC_API_VERSION, authenticator=authenticator)
+        self.authenticator = ibm_cloud_sdk_core.authenticators.IAMAuthenticator(self.iam_api_key, url=self.config.get("iam_endpoint"))
+        vpc_cli = ibm_vpc.VpcV1(VPC_API_VERSION, authenticator=self.authenticator)
         vpc_cli.set_service_url(self.config["endpoint"] + "/v1")
+        enlarge_http_pool(vpc_cli)
         return vpc_cli
 
+    def _prefetch_iam_token(self):
+        """
+        Fetches (or refreshes) the IAM token before fanning out to threads,
+        so they don't all queue behind the first token request
+        """
+        self.authenticator.token_manager.get_token()
+
     def _load_vpc_data(self):
         """
         Loads VPC data from local cache
         """
         self.vpc_data = load_yaml_config(self.vpc_data_filename)
+        self.vpc_data_on_disk = dict(self.vpc_data)
         print("load VPC data")
         print(self.vpc_data)
 
@@ -95,9 +182,11 @@ class IBMVPCBackend:
 
     def _dump_vpc_data(self):
         """
-        Dumps VPC data to local cache
+        Dumps VPC data to local cache, unless the cache already holds the same data
         """
-        dump_yaml_config(self.vpc_data_filename, self.vpc_data)
+        if self.vpc_data != self.vpc_data_on_disk:
+            dump_yaml_config(self.vpc_data_filename, self.vpc_data)
+            self.vpc_data_on_disk = dict(self.vpc_data)
 
     @imports.inject("ibm_cloud_sdk_core", pip_extra="ibmcloud")
     def _create_vpc(ibm_cloud_sdk_core, self):
@@ -119,19 +208,14 @@ class IBMVPCBackend:
             except ibm_cloud_sdk_core.ApiException:
                 pass
 
-        vpc_info = None
-
         host_id = str(uuid.getnode())[-6:]
         iam_id = self.iam_api_key[:4].lower()
         self.vpc_name = self.config.get("vpc_name", f"skyplane-vpc-{iam_id}-{host_id}")
         logger.debug(f"Setting VPC name to: {self.vpc_name}")
 
-        assert re.match("^[a-z0-9-:-]*$", self.vpc_name), 'VPC name "{}" not valid'.format(self.vpc_name)
+        assert VPC_NAME_RE.match(self.vpc_name), 'VPC name "{}" not valid'.format(self.vpc_name)
 
-        vpcs_info = self.vpc_cli.list_vpcs().get_result()
-        for vpc in vpcs_info["vpcs"]:
-            if vpc["name"] == self.vpc_name:
-                vpc_info = vpc
+        vpc_info = next((vpc for vpc in iter_paginated(self.vpc_cli.list_vpcs, "vpcs") if vpc["name"] == self.vpc_name), None)
 
         if not vpc_info:
             logger.debug(f"Creating VPC {self.vpc_name}")
@@ -168,9 +252,9 @@ class IBMVPCBackend:
 
         sg_rules = self.vpc_cli.get_security_group(self.config["security_group_id"])
         for rule in sg_rules.get_result()["rules"]:
-            if all(item in rule.items() for item in sg_rule_prototype_ssh.items()):
+            if sg_rule_prototype_ssh.items() <= rule.items():
                 deloy_ssh_rule = False
-            if all(item in rule.items() for item in sg_rule_prototype_icmp.items()):
+            if sg_rule_prototype_icmp.items() <= rule.items():
                 deploy_icmp_rule = False
 
         if deloy_ssh_rule:
@@ -194,16 +278,12 @@ class IBMVPCBackend:
             except ibm_cloud_sdk_core.ApiException:
                 pass
 
-        keyname = f"skyplane-key-{str(uuid.getnode())[-6:]}"
-        filename = os.path.join("~", ".ssh", f"{keyname}.id_rsa")
-        key_filename = os.path.expanduser(filename)
+        keyname, key_filename = self.ssh_key_name, self.ssh_key_filename
 
         key_info = None
 
         def _get_ssh_key():
-            for key in self.vpc_cli.list_keys().result["keys"]:
-                if key["name"] == keyname:
-                    return key
+            return next((key for key in iter_paginated(self.vpc_cli.list_keys, "keys") if key["name"] == keyname), None)
 
         print(key_filename)
         if not os.path.isfile(key_filename):
@@ -261,12 +341,9 @@ class IBMVPCBackend:
                 pass
 
         subnet_name = f"skyplane-subnet-{self.vpc_key}"
-        subnet_data = None
 
-        subnets_info = self.vpc_cli.list_subnets(resource_group_id=self.config["resource_group_id"]).get_result()
-        for sn in subnets_info["subnets"]:
-            if sn["name"] == subnet_name:
-                subnet_data = sn
+        subnets = iter_paginated(self.vpc_cli.list_subnets, "subnets", resource_group_id=self.config["resource_group_id"])
+        subnet_data = next((sn for sn in subnets if sn["name"] == subnet_name), None)
 
         if not subnet_data:
             logger.debug(f"Creating Subnet {subnet_name}")
@@ -301,12 +378,9 @@ class IBMVPCBackend:
                 pass
 
         gateway_name = f"skyplane-gateway-{self.vpc_key}"
-        gateway_data = None
 
-        gateways_info = self.vpc_cli.list_public_gateways().get_result()
-        for gw in gateways_info["public_gateways"]:
-            if gw["vpc"]["id"] == self.config["vpc_id"]:
-                gateway_data = gw
+        gateways = iter_paginated(self.vpc_cli.list_public_gateways, "public_gateways")
+        gateway_data = next((gw for gw in gateways if gw["vpc"]["id"] == self.config["vpc_id"]), None)
 
         if not gateway_data:
             logger.debug(f"Creating Gateway {gateway_name}")
@@ -330,13 +404,18 @@ class IBMVPCBackend:
 
         floating_ip_data = None
         if not disable_recycle:
-            floating_ips_info = self.vpc_cli.list_floating_ips().get_result()
-            for fip in floating_ips_info["floating_ips"]:
-                if fip["name"].startswith("skyplane") and fip["status"] == "available":
-                    floating_ip_data = fip
+            # any unattached skyplane floating IP will do, so stop at the first one
+            floating_ip_data = next(
+                (
+                    fip
+                    for fip in iter_paginated(self.vpc_cli.list_floating_ips, "floating_ips")
+                    if fip["status"] == "available" and fip["name"].startswith(FIP_NAME_PREFIX)
+                ),
+                None,
+            )
 
         if not floating_ip_data:
-            floating_ip_name = f"skyplane-{str(uuid.uuid1())[-4:]}-{str(random.randint(1000,9999))}"
+            floating_ip_name = f"{FIP_NAME_PREFIX}{str(uuid.uuid1())[-4:]}-{str(random.randint(1000,9999))}"
             logger.debug(f"Creating floating IP {floating_ip_name}")
             floating_ip_prototype = {}
             floating_ip_prototype["name"] = floating_ip_name
@@ -350,6 +429,8 @@ class IBMVPCBackend:
         return floating_ip, floating_ip_id
 
     def add_ips_to_security_group(self, ip_address):
+        # fetch the rules once for all IPs rather than once per IP
+        sg_rules = self.vpc_cli.get_security_group(self.config["security_group_id"]).get_result()["rules"]
         for ip in ip_address:
             ip_rule = {}
             ip_rule["direction"] = "inbound"
@@ -359,16 +440,14 @@ class IBMVPCBackend:
             remote["address"] = ip
             ip_rule["remote"] = remote
 
-            deploy_ip_rule = True
-            sg_rules = self.vpc_cli.get_security_group(self.config["security_group_id"])
-            for rule in sg_rules.get_result()["rules"]:
-                if all(item in rule.items() for item in ip_rule.items()):
-                    deploy_ip_rule = False
+            # ItemsView <= is a subset test, so a rule matches if it contains every field of ip_rule
+            deploy_ip_rule = not any(ip_rule.items() <= rule.items() for rule in sg_rules)
 
             if deploy_ip_rule:
                 logger.debug(f"About to create ip rule for {ip}")
                 try:
                     self.vpc_cli.create_security_group_rule(self.config["security_group_id"], ip_rule)
+                    sg_rules.append(ip_rule)
                     logger.debug(f"Created rule for {ip_rule}")
                 except Exception as e:
                     raise e
@@ -377,38 +456,44 @@ class IBMVPCBackend:
         """
         Creates the master VM insatnce
         """
-        if "image_id" not in self.config and "image_id" in self.vpc_data:
-            self.config["image_id"] = self.vpc_data["image_id"]
-
-        if "image_id" not in self.config:
-            for image in self.vpc_cli.list_images().result["images"]:
-                if "ubuntu-22" in image["name"]:
-                    self.config["image_id"] = image["id"]
-
-        name = f"skyplane-ibm-vsi-{self.vpc_key}-{str(uuid.uuid4().hex[:8])}"
-        vsi = IBMVPCInstance(name, self.config, self.vpc_cli, public)
-
-        floating_ip, floating_ip_id = self._create_floating_ip()
-        if public:
-            vsi.public_ip = floating_ip
-            vsi.floating_ip_id = floating_ip_id
-
-        vsi.instance_id = None
-        vsi.profile_name = self.config["master_profile_name"]
-        vsi.delete_on_dismantle = False
-        vsi.ssh_credentials.pop("password")
-
-        instance_data = vsi.get_instance_data()
-        if instance_data:
-            vsi.private_ip = instance_data["primary_network_interface"]["primary_ipv4_address"]
-            vsi.instance_id = instance_data["id"]
+        # bound concurrent control-plane calls when many gateways are provisioned at once (the VPC API is rate limited);
+        # the SSH readiness wait below runs outside the semaphore
+        with self.provisioning_semaphore:
+            if "image_id" not in self.config and "image_id" in self.vpc_data:
+                self.config["image_id"] = self.vpc_data["image_id"]
+
+            if "image_id" not in self.config:
+                for image in self.vpc_cli.list_images().result["images"]:
+                    if "ubuntu-22" in image["name"]:
+                        self.config["image_id"] = image["id"]
+
+            name = f"{VSI_NAME_PREFIX}-vsi-{self.vpc_key}-{str(uuid.uuid4().hex[:8])}"
+            vsi = IBMVPCInstance(name, self.config, self.vpc_cli, public)
+
+            floating_ip, floating_ip_id = self._create_floating_ip()
+            if public:
+                vsi.public_ip = floating_ip
+                vsi.floating_ip_id = floating_ip_id
+
+            vsi.instance_id = None
+            vsi.profile_name = self.config["master_profile_name"]
+            if self.prototype_template is None:
+                self.prototype_template = IBMVPCInstance.build_prototype_template(self.config, vsi.profile_name)
+            vsi.prototype_template = self.prototype_template
+            vsi.delete_on_dismantle = False
+            vsi.ssh_credentials.pop("password")
+
+            # look the instance up once: create() below starts it if it exists, so it doesn't need to list instances again
+            instance_data = vsi.get_instance_data()
+            if instance_data:
+                vsi.private_ip = instance_data["primary_network_interface"]["primary_ipv4_address"]
+                vsi.instance_id = instance_data["id"]
 
-        instance_id = vsi.create(check_if_exists=True)
+            instance_id = vsi.create()
         if not vsi.is_ready():
-            instance_id = vsi.create(check_if_exists=True)
             vsi.wait_ready()
-            self.workers.append(vsi)
-            instance_data = vsi.get_instance_data()
+            with self.workers_lock:
+                self.workers.append(vsi)
 
         return instance_id, vsi
 
@@ -462,33 +547,27 @@ class IBMVPCBackend:
                 else:
                     raise err
 
-        vms_prefixes = ("skyplane-ibm") if all else ("skyplane-ibm",)
+        # only list this VPC's instances
+        list_filters = {"vpc_id": self.config["vpc_id"]} if "vpc_id" in self.config else {}
 
         def get_instances():
-            instances = set()
-            instances_info = self.vpc_cli.list_instances().get_result()
-            for ins in instances_info["instances"]:
-                if ins["name"].startswith(vms_prefixes):
-                    instances.add((ins["name"], ins["id"]))
-            return instances
+            instances = iter_paginated(self.vpc_cli.list_instances, "instances", **list_filters)
+            return {(ins["name"], ins["id"]) for ins in instances if ins["name"].startswith(VSI_NAME_PREFIX)}
 
         deleted_instances = set()
-        while True:
-            instances_to_delete = set()
-            for ins_to_delete in get_instances():
-                if ins_to_delete not in deleted_instances:
-                    instances_to_delete.add(ins_to_delete)
 
+        def delete_new_instances():
+            # one listing per poll both finds instances that appeared since the last one and tells whether all are gone
+            instances = get_instances()
+            instances_to_delete = instances - deleted_instances
             if instances_to_delete:
-                with ThreadPoolExecutor(len(instances_to_delete)) as executor:
-                    executor.map(delete_instance, instances_to_delete)
+                wait([self.executor.submit(delete_instance, ins) for ins in instances_to_delete])
                 deleted_instances.update(instances_to_delete)
-            else:
-                break
+            return not instances
 
         # Wait until all instances are deleted
-        while get_instances():
-            time.sleep(1)
+        if not wait_with_backoff(delete_new_instances, timeout=INSTANCE_DELETE_TIMEOUT):
+            raise TimeoutError(f"Instances in {self.vpc_name or self.region} were not deleted after {INSTANCE_DELETE_TIMEOUT} seconds")
 
     @imports.inject("ibm_cloud_sdk_core", pip_extra="ibmcloud")
     def _delete_subnet(ibm_cloud_sdk_core, self):
@@ -497,11 +576,10 @@ class IBMVPCBackend:
         """
         subnet_name = f"skyplane-subnet-{self.vpc_key}"
         if "subnet_id" not in self.vpc_data:
-            subnets_info = self.vpc_cli.list_subnets().get_result()
-
-            for subn in subnets_info["subnets"]:
+            for subn in iter_paginated(self.vpc_cli.list_subnets, "subnets"):
                 if subn["name"] == subnet_name:
                     self.vpc_data["subnet_id"] = subn["id"]
+                    break
 
         if "subnet_id" in self.vpc_data:
             logger.info(f"Deleting subnet {subnet_name}")
@@ -529,11 +607,10 @@ class IBMVPCBackend:
         """
         gateway_name = f"skyplane-gateway-{self.vpc_key}"
         if "gateway_id" not in self.vpc_data:
-            gateways_info = self.vpc_cli.list_public_gateways().get_result()
-
-            for gw in gateways_info["public_gateways"]:
-                if ["name"] == gateway_name:
+            for gw in iter_paginated(self.vpc_cli.list_public_gateways, "public_gateways"):
+                if gw["name"] == gateway_name:
                     self.vpc_data["gateway_id"] = gw["id"]
+                    break
 
         if "gateway_id" in self.vpc_data:
             logger.info(f"Deleting gateway {gateway_name}")
@@ -550,9 +627,7 @@ class IBMVPCBackend:
         """
         Deletes the ssh key
         """
-        keyname = f"skyplane-key-{str(uuid.getnode())[-6:]}"
-        filename = os.path.join("~", ".ssh", f"{keyname}.id_rsa")
-        key_filename = os.path.expanduser(filename)
+        keyname, key_filename = self.ssh_key_name, self.ssh_key_filename
 
         if os.path.isfile(key_filename):
             os.remove(key_filename)
@@ -560,9 +635,10 @@ class IBMVPCBackend:
             os.remove(f"{key_filename}.pub")
 
         if "ssh_key_id" not in self.vpc_data:
-            for key in self.vpc_cli.list_keys().result["keys"]:
+            for key in iter_paginated(self.vpc_cli.list_keys, "keys"):
                 if key["name"] == keyname:
                     self.vpc_data["ssh_key_id"] = key["id"]
+                    break
 
         if "ssh_key_id" in self.vpc_data:
             logger.info(f"Deleting SSH key {keyname}")
@@ -573,6 +649,9 @@ class IBMVPCBackend:
                     logger.debug(err)
                 else:
                     raise err
+            # evict just the deleted key, public keys cached for other deployments' keys stay valid
+            with PUBLIC_KEYS_LOCK:
+                PUBLIC_KEYS_BY_ID.pop(self.vpc_data["ssh_key_id"], None)
 
     @imports.inject("ibm_cloud_sdk_core", pip_extra="ibmcloud")
     def _delete_vpc(ibm_cloud_sdk_core, self):
@@ -580,10 +659,10 @@ class IBMVPCBackend:
         Deletes the VPC
         """
         if "vpc_id" not in self.vpc_data:
-            vpcs_info = self.vpc_cli.list_vpcs().get_result()
-            for vpc in vpcs_info["vpcs"]:
+            for vpc in iter_paginated(self.vpc_cli.list_vpcs, "vpcs"):
                 if vpc["name"] == self.vpc_name:
                     self.vpc_data["vpc_id"] = vpc["id"]
+                    break
 
         if "vpc_id" in self.vpc_data:
             logger.info(f'Deleting VPC {self.vpc_data["vpc_id"]}')
@@ -601,14 +680,23 @@ class IBMVPCBackend:
         The gateway public IP and the floating IP are never deleted
         """
         logger.debug("Cleaning IBM VPC resources")
+        self._prefetch_iam_token()
 
         self._delete_vm_instances(all=all)
 
         if all:
-            self._load_vpc_data()
-            self._delete_subnet()
-            self._delete_gateway()
-            self._delete_ssh_key()
+            if self.vpc_data is None:  # init() already loaded and refreshed the cache otherwise
+                self._load_vpc_data()
+
+            def delete_network():
+                # the gateway can only be deleted once it is detached from the subnet
+                self._delete_subnet()
+                self._delete_gateway()
+
+            # the ssh key doesn't depend on the network, so delete it concurrently; the VPC must go last
+            futures = [self.executor.submit(delete_network), self.executor.submit(self._delete_ssh_key)]
+            for future in futures:
+                future.result()
             self._delete_vpc()
 
             delete_yaml_config(self.vpc_data_filename)
@@ -624,10 +712,26 @@ class IBMVPCBackend:
         """
         Stop all worker VM instances
         """
-        if len(self.workers) > 0:
-            with ThreadPoolExecutor(min(len(self.workers), 48)) as ex:
-                ex.map(lambda worker: worker.stop(), self.workers)
-            self.workers = []
+        # take the current list and stop its workers outside the lock, so concurrent provisioning isn't blocked or lost
+        with self.workers_lock:
+            workers, self.workers = self.workers, []
+        if len(workers) > 0:
+            self._prefetch_iam_token()
+            wait([self.executor.submit(worker.stop) for worker in workers])
+
+    def close(self):
+        """
+        Shuts down the backend's thread pool, waiting for submitted calls to finish.
+        The backend can't be used afterwards
+        """
+        self.executor.shutdown(wait=True)
+
+    def forget_worker(self, vsi):
+        """
+        Drops a worker deleted outside dismantle(), so the list only holds live workers
+        """
+        with self.workers_lock:
+            self.workers = [worker for worker in self.workers if worker is not vsi]
 
     def get_instance(self, name, **kwargs):
         """
@@ -670,9 +774,12 @@ class IBMVPCInstance:
         self.ssh_client = None
         self.instance_id = None
         self.instance_data = None
+        self.instance_data_ts = 0
+        self.instance_data_gen = 0  # bumped whenever the instance is deleted, see get_instance_data
         self.private_ip = None
         self.public_ip = None
         self.floating_ip_id = None
+        self.prototype_template = None  # shared prototype fields, see build_prototype_template
         self.home_dir = "/root"
 
         self.ssh_credentials = {
@@ -700,6 +807,7 @@ class IBMVPCInstance:
         )
         ibm_vpc_client = ibm_vpc.VpcV1(VPC_API_VERSION, authenticator=authenticator)
         ibm_vpc_client.set_service_url(self.config["endpoint"] + "/v1")
+        enlarge_http_pool(ibm_vpc_client)
 
         # decorate instance public methods with except/retry logic
         decorate_instance(self.vpc_cli, vpc_retry_on_except)
@@ -724,7 +832,7 @@ class IBMVPCInstance:
             private_res = paramiko.RSAKey(filename=key_filename).get_base64()
             names = []
             for k in initialization_data["keys"]:
-                public_res = self.vpc_cli.get_key(k["id"]).get_result()["public_key"].split(" ")[1]
+                public_res = self._get_public_key(k["id"]).split(" ")[1]
                 if public_res == private_res:
                     self.validated = True
                     break
@@ -740,6 +848,20 @@ class IBMVPCInstance:
 
         return self.ssh_client
 
+    def _get_public_key(self, key_id):
+        with PUBLIC_KEYS_LOCK:
+            public_key = PUBLIC_KEYS_BY_ID.get(key_id)
+            if public_key is not None:
+                PUBLIC_KEYS_BY_ID.move_to_end(key_id)
+                return public_key
+        # fetch outside the lock, VSIs of other deployments shouldn't wait on this round trip
+        public_key = self.vpc_cli.get_key(key_id).get_result()["public_key"]
+        with PUBLIC_KEYS_LOCK:
+            PUBLIC_KEYS_BY_ID[key_id] = public_key
+            while len(PUBLIC_KEYS_BY_ID) > PUBLIC_KEYS_MAX_ENTRIES:
+                PUBLIC_KEYS_BY_ID.popitem(last=False)
+        return public_key
+
     def del_ssh_client(self):
         """
         Deletes the ssh client
@@ -777,12 +899,22 @@ class IBMVPCInstance:
         else:
             self.get_private_ip()
 
-        while time.time() - start < timeout:
-            if self.is_ready():
-                start_time = round(time.time() - start, 2)
-                logger.debug(f"{self} ready in {start_time} seconds")
-                return True
-            time.sleep(5)
+        transitional = self.instance_id is not None
+
+        def _is_ready():
+            # SSH can't succeed while the VSI is still provisioning, so poll its status (one cheap API call) until it leaves the
+            # transitional states, and only then start the SSH probes
+            nonlocal transitional
+            if transitional:
+                transitional = self.vpc_cli.get_instance(self.instance_id).get_result()["status"] in ("pending", "starting")
+                if transitional:
+                    return False
+            return self.is_ready()
+
+        if wait_with_backoff(_is_ready, timeout=timeout, initial_sleep=1):
+            start_time = round(time.time() - start, 2)
+            logger.debug(f"{self} ready in {start_time} seconds")
+            return True
 
         raise TimeoutError(f"Readiness probe expired on {self}")
 
@@ -793,30 +925,12 @@ class IBMVPCInstance:
         """
         logger.debug("Creating new VM instance {}".format(self.name))
 
-        security_group_identity_model = {"id": self.config["security_group_id"]}
-        subnet_identity_model = {"id": self.config["subnet_id"]}
-        primary_network_interface = {"name": "eth0", "subnet": subnet_identity_model, "security_groups": [security_group_identity_model]}
+        template = self.prototype_template or self.build_prototype_template(self.config, self.profile_name)
+        boot_volume_data = {**template["boot_volume"], "name": f"{self.name}-{str(uuid.uuid4())[:4]}-boot"}
 
-        boot_volume_data = {
-            "capacity": self.config["boot_volume_capacity"],
-            "name": f"{self.name}-{str(uuid.uuid4())[:4]}-boot",
-            "profile": {"name": self.config["boot_volume_profile"]},
-        }
-
-        boot_volume_attachment = {"delete_volume_on_instance_delete": True, "volume": boot_volume_data}
-
-        key_identity_model = {"id": self.config["ssh_key_id"]}
-
-        instance_prototype = {}
+        instance_prototype = {k: v for k, v in template.items() if k != "boot_volume"}
         instance_prototype["name"] = self.name
-        instance_prototype["keys"] = [key_identity_model]
-        instance_prototype["profile"] = {"name": self.profile_name}
-        instance_prototype["resource_group"] = {"id": self.config["resource_group_id"]}
-        instance_prototype["vpc"] = {"id": self.config["vpc_id"]}
-        instance_prototype["image"] = {"id": self.config["image_id"]}
-        instance_prototype["zone"] = {"name": self.config["zone_name"]}
-        instance_prototype["boot_volume_attachment"] = boot_volume_attachment
-        instance_prototype["primary_network_interface"] = primary_network_interface
+        instance_prototype["boot_volume_attachment"] = {"delete_volume_on_instance_delete": True, "volume": boot_volume_data}
 
         if user_data:
             instance_prototype["user_data"] = user_data
@@ -836,6 +950,26 @@ class IBMVPCInstance:
 
         return resp.result
 
+    @staticmethod
+    def build_prototype_template(config, profile_name):
+        """
+        Builds the parts of the instance prototype that are the same for every VM instance created from config
+        """
+        security_group_identity_model = {"id": config["security_group_id"]}
+        subnet_identity_model = {"id": config["subnet_id"]}
+        primary_network_interface = {"name": "eth0", "subnet": subnet_identity_model, "security_groups": [security_group_identity_model]}
+
+        template = {}
+        template["keys"] = [{"id": config["ssh_key_id"]}]
+        template["profile"] = {"name": profile_name}
+        template["resource_group"] = {"id": config["resource_group_id"]}
+        template["vpc"] = {"id": config["vpc_id"]}
+        template["image"] = {"id": config["image_id"]}
+        template["zone"] = {"name": config["zone_name"]}
+        template["primary_network_interface"] = primary_network_interface
+        template["boot_volume"] = {"capacity": config["boot_volume_capacity"], "profile": {"name": config["boot_volume_profile"]}}
+        return template
+
     def _attach_floating_ip(self, fip, fip_id, instance):
         """
         Attach a floating IP address to VM
@@ -855,16 +989,24 @@ class IBMVPCInstance:
     def _delete_floating_ip(self, fip_id):
         response = self.vpc_cli.delete_floating_ip(id=fip_id)
 
-    def get_instance_data(self):
+    def get_instance_data(self, force_refresh=False):
         """
-        Returns the instance information
+        Returns the instance information, reusing a record fetched less than INSTANCE_DATA_TTL seconds ago
         """
-        # if self.instance_id:
-        #    self.instance_data = self.vpc_cli.get_instance(self.instance_id).get_result()
+        if self.instance_data and not force_refresh and time.monotonic() - self.instance_data_ts < INSTANCE_DATA_TTL:
+            return self.instance_data
 
-        instances_data = self.vpc_cli.list_instances(name=self.name).get_result()
-        if len(instances_data["instances"]) > 0:
-            self.instance_data = instances_data["instances"][0]
+        # a delete that lands while the request is in flight must win over the record it returns
+        gen = self.instance_data_gen
+        if self.instance_id:
+            instance_data = self.vpc_cli.get_instance(self.instance_id).get_result()
+        else:
+            instances_data = self.vpc_cli.list_instances(name=self.name).get_result()
+            instance_data = instances_data["instances"][0] if len(instances_data["instances"]) > 0 else self.instance_data
+        if gen != self.instance_data_gen:
+            return None
+        self.instance_data = instance_data
+        self.instance_data_ts = time.monotonic()
 
         return self.instance_data
 
@@ -884,10 +1026,17 @@ class IBMVPCInstance:
         """
         Requests the private IP address
         """
-        while not self.private_ip or self.private_ip == "0.0.0.0":
-            time.sleep(1)
-            instance_data = self.get_instance_data()
+
+        def _has_private_ip():
+            instance_data = self.get_instance_data(force_refresh=True)
+            if not instance_data:
+                return False
             self.private_ip = instance_data["primary_network_interface"]["primary_ipv4_address"]
+            return self.private_ip and self.private_ip != "0.0.0.0"
+
+        if not self.private_ip or self.private_ip == "0.0.0.0":
+            if not wait_with_backoff(_has_private_ip, timeout=INSTANCE_START_TIMEOUT):
+                raise TimeoutError(f"No private IP assigned to {self} after {INSTANCE_START_TIMEOUT} seconds")
 
         return self.private_ip
 
@@ -915,6 +1064,11 @@ class IBMVPCInstance:
         if not vsi_exists:
             instance = self._create_instance(user_data=user_data)
             self.instance_id = instance["id"]
+            self.instance_data = instance
+            # the private IP never changes once assigned, so keep it when the create response already has it
+            primary_ip = instance["primary_network_interface"]["primary_ipv4_address"]
+            if primary_ip and primary_ip != "0.0.0.0":
+                self.private_ip = primary_ip
         else:
             self.start()
 
@@ -953,6 +1107,8 @@ class IBMVPCInstance:
                 pass
             else:
                 raise err
+        self.instance_data_gen += 1
+        self.instance_data = None
         self.instance_id = None
         self.private_ip = None
         self.del_ssh_client()
@@ -984,8 +1140,14 @@ class IBMVPCInstance:
         """
         Deletes the VM instance
         """
+        if self.floating_ip_id is None:
+            self._delete_instance()
+            return
+        # deleting a floating IP also unbinds it, so both deletes can be in flight at once
+        fip_future = FIP_DELETE_EXECUTOR.submit(self._delete_floating_ip, self.floating_ip_id)
         self._delete_instance()
-        self._delete_floating_ip(self.floating_ip_id)
+        fip_future.result()
+        self.floating_ip_id = None
 
     def validate_capabilities(self):
         """
@@ -1002,7 +1164,7 @@ class IBMVPCInstance:
                 raise Exception(f"Not using single CPU socket as specified, using {len(sockets)} sockets instead")
 
 
-RETRIABLE = [
+RETRIABLE = {
     "list_vpcs",
     "create_vpc",
     "get_security_group",
@@ -1026,10 +1188,8 @@ RETRIABLE = [
     "get_key",
     "create_instance",
     "add_instance_network_interface_floating_ip",
-    "get_instance",
     "create_instance_action",
-    "delete_instance",
-]
+}
 
 
 def decorate_instance(instance, decorator):
@@ -1045,7 +1205,7 @@ def vpc_retry_on_except(ibm_cloud_sdk_core, func):
     SLEEP_FACTOR = 1.5
     MAX_SLEEP = 30
 
-    IGNORED_404_METHODS = ["delete_instance", "delete_public_gateway", "delete_vpc", "create_instance_action"]
+    IGNORED_404_METHODS = {"delete_instance", "delete_floating_ip", "delete_public_gateway", "delete_vpc", "create_instance_action"}
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
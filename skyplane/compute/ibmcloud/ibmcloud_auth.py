@@ -1,3 +1,5 @@
+import os
+import threading
 from typing import Optional
 from skyplane.config_paths import config_path, ibmcloud_config_path
 from skyplane.config import SkyplaneConfig
@@ -20,18 +22,29 @@ class IBMCloudAuthentication:
         else:
             self.config = SkyplaneConfig.load_config(config_path)
 
-        self.user_agent = self.config.ibmcloud_useragent if self.config.ibmcloud_useragent is not None else "skyplane-ibm"
-        self._ibmcloud_resource_group_id = self.config.ibmcloud_resource_group_id
+        config = self.config
+        user_agent = config.ibmcloud_useragent
+        self.user_agent = user_agent if user_agent is not None else "skyplane-ibm"
+        self._ibmcloud_resource_group_id = config.ibmcloud_resource_group_id
 
-        if self.config.ibmcloud_access_id and self.config.ibmcloud_secret_key:
-            self._access_key = self.config.ibmcloud_access_id
-            self._secret_key = self.config.ibmcloud_secret_key
-        if self.config.ibmcloud_iam_key:
-            self._iam_key = self.config.ibmcloud_iam_key
+        self._access_key, self._secret_key = None, None
+        access_id, secret_key = config.ibmcloud_access_id, config.ibmcloud_secret_key
+        if access_id and secret_key:
+            self._access_key = access_id
+            self._secret_key = secret_key
+        self._iam_key = config.ibmcloud_iam_key or None
+
+        self._vpc_clients = {}  # (iam key, iam endpoint) -> VpcV1, see save_region_config
+
+        # a session loads the botocore data files and credential chain when built, so build it once; sessions aren't thread
+        # safe, so clients and resources are created from it under a lock
+        self._boto3_session = None
+        self._boto3_session_lock = threading.Lock()
+        self._boto3_clients = {}  # (service_name, cos_region) -> client, boto3 clients are thread safe once built
 
     @imports.inject("ibm_cloud_sdk_core", "ibm_cloud_sdk_core.authenticators", pip_extra="ibmcloud")
     def get_iam_authenticator(ibm_cloud_sdk_core, self):
-        return ibm_cloud_sdk_core.authenticators.IAMAuthenticator(self.config.ibmcloud_iam_key, url=self.config.ibmcloud_iam_endpoint)
+        return ibm_cloud_sdk_core.authenticators.IAMAuthenticator(self._iam_key, url=self.config.ibmcloud_iam_endpoint)
 
     def get_ibmcloud_endpoint(self, region, compute_backend="public"):
         if region is not None:
@@ -47,22 +60,35 @@ class IBMCloudAuthentication:
         if not config.ibmcloud_enabled:
             self.clear_region_config()
             return
-        with ibmcloud_config_path.open("w") as f:
-            region_list = []
-            authenticator = ibm_cloud_sdk_core.authenticators.IAMAuthenticator(config.ibmcloud_iam_key, url=config.ibmcloud_iam_endpoint)
+        region_list = []
+        # config may be a newer config than the one this object was built from, so its key is read here rather than self._iam_key
+        iam_key, iam_endpoint = config.ibmcloud_iam_key, config.ibmcloud_iam_endpoint
+        ibm_vpc_client = self._vpc_clients.get((iam_key, iam_endpoint))
+        if ibm_vpc_client is None:
+            # the client keeps its IAM token and connection pool, so later saves skip the IAM round trip and TLS handshakes
+            authenticator = ibm_cloud_sdk_core.authenticators.IAMAuthenticator(iam_key, url=iam_endpoint)
             ibm_vpc_client = ibm_vpc.VpcV1(VPC_API_VERSION, authenticator=authenticator)
-            res = ibm_vpc_client.list_regions()
-            for region in res.result["regions"]:
-                if region["status"] == "available":
-                    zones = ibm_vpc_client.list_region_zones(region["name"])
-                    for zone in zones.result["zones"]:
-                        if zone["status"] == "available":
-                            region_list.append("{},{},{},{}".format(zone["region"]["name"], region["href"], zone["name"], zone["href"]))
-            f.write("\n".join(region_list))
+            self._vpc_clients[(iam_key, iam_endpoint)] = ibm_vpc_client
+        res = ibm_vpc_client.list_regions()
+        for region in res.result["regions"]:
+            if region["status"] == "available":
+                zones = ibm_vpc_client.list_region_zones(region["name"])
+                for zone in zones.result["zones"]:
+                    if zone["status"] == "available":
+                        region_list.append("{},{},{},{}".format(zone["region"]["name"], region["href"], zone["name"], zone["href"]))
+        self._write_region_config("\n".join(region_list))
 
     def clear_region_config(self):
-        with ibmcloud_config_path.open("w") as f:
-            f.write("")
+        self._write_region_config("")
+
+    @staticmethod
+    def _write_region_config(contents: str):
+        # the region listing takes one API call per region, so only touch the file once it is complete, and swap it in
+        # atomically so a concurrent get_region_config never parses a truncated file
+        tmp_path = ibmcloud_config_path.with_name(f"{ibmcloud_config_path.name}.tmp.{os.getpid()}")  # per process, so writers don't collide
+        with tmp_path.open("w") as f:
+            f.write(contents)
+        os.replace(tmp_path, ibmcloud_config_path)
 
     @staticmethod
     def get_region_config():
@@ -71,13 +97,17 @@ class IBMCloudAuthentication:
         except FileNotFoundError:
             return []
         region_list = {}
-        for region in f.read().split("\n"):
-            line = region.split(",")
-            if line[0] not in region_list:
-                region_list[line[0]] = {}
-                region_list[line[0]]["zones"] = []
-            region_list[line[0]]["href"] = line[1]
-            region_list[line[0]]["zones"].append({"zone_name": line[2], "zone_href": line[3]})
+        with f:
+            for region in f:
+                region = region.strip()
+                if not region:  # clear_region_config leaves an empty file
+                    continue
+                line = region.split(",")
+                if line[0] not in region_list:
+                    region_list[line[0]] = {}
+                    region_list[line[0]]["zones"] = []
+                region_list[line[0]]["href"] = line[1]
+                region_list[line[0]]["zones"].append({"zone_name": line[2], "zone_href": line[3]})
 
         return region_list
 
@@ -106,13 +136,23 @@ class IBMCloudAuthentication:
 
     @imports.inject("ibm_boto3", pip_extra="ibmcloud")
     def get_boto3_session(ibm_boto3, self, cos_region: Optional[str] = None):
-        return ibm_boto3.Session(aws_access_key_id=self.access_key, aws_secret_access_key=self.secret_key)
+        if self._boto3_session is None:
+            with self._boto3_session_lock:
+                if self._boto3_session is None:
+                    self._boto3_session = ibm_boto3.Session(aws_access_key_id=self.access_key, aws_secret_access_key=self.secret_key)
+        return self._boto3_session
 
     def get_boto3_resource(self, service_name, cos_region=None):
-        return self.get_boto3_session().resource(service_name, region_name=cos_region)
+        session = self.get_boto3_session()
+        with self._boto3_session_lock:
+            return session.resource(service_name, region_name=cos_region)
 
     @imports.inject("ibm_boto3", "ibm_botocore", pip_extra="ibmcloud")
     def get_boto3_client(ibm_boto3, ibm_botocore, self, service_name, cos_region=None):
+        client = self._boto3_clients.get((service_name, cos_region))
+        if client is not None:
+            return client
+
         client_config = ibm_botocore.client.Config(
             max_pool_connections=128,
             user_agent_extra=self.user_agent,
@@ -121,7 +161,13 @@ class IBMCloudAuthentication:
             retries={"max_attempts": OBJ_REQ_RETRIES},
         )
 
-        if cos_region is None:
-            return self.get_boto3_session().client(service_name, config=client_config)
-        else:
-            return self.get_boto3_session().client(service_name, endpoint_url=self.get_ibmcloud_endpoint(cos_region), config=client_config)
+        session = self.get_boto3_session()
+        with self._boto3_session_lock:
+            client = self._boto3_clients.get((service_name, cos_region))
+            if client is None:
+                if cos_region is None:
+                    client = session.client(service_name, config=client_config)
+                else:
+                    client = session.client(service_name, endpoint_url=self.get_ibmcloud_endpoint(cos_region), config=client_config)
+                self._boto3_clients[(service_name, cos_region)] = client
+        return client
@@ -1,4 +1,3 @@
-from multiprocessing import BoundedSemaphore
 from typing import List, Optional
 
 from skyplane.compute.ibmcloud.ibmcloud_auth import IBMCloudAuthentication
@@ -20,7 +19,6 @@ class IBMCloudProvider(CloudProvider):
         self.key_prefix = key_prefix
         self.auth = auth if auth else IBMCloudAuthentication()
         self.regions_vpc = {}
-        self.provisioning_semaphore = BoundedSemaphore(16)
 
     @property
     def name(self):
@@ -47,11 +45,15 @@ class IBMCloudProvider(CloudProvider):
 
     def teardown_region(self, region):
         if region in self.regions_vpc:
-            self.regions_vpc[region].clean(all=True)
+            ibm_vpc_backend = self.regions_vpc.pop(region)
+            try:
+                ibm_vpc_backend.clean(all=True)
+            finally:
+                ibm_vpc_backend.close()
 
     def teardown_global(self):
-        for region in self.regions_vpc:
-            self.regions_vpc[region].clean(all=True)
+        for region in list(self.regions_vpc):
+            self.teardown_region(region)
 
     def add_ips_to_security_group(self, cos_region: str, ips: Optional[List[str]] = None):
         return self.regions_vpc[cos_region].add_ips_to_security_group(ips)
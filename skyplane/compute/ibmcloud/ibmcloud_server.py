@@ -41,8 +41,10 @@ class IBMCloudServer(Server):
         return public_ip
 
     @ignore_lru_cache()
-    def private_ip(self) -> str:
-        return self.vsi.private_ip
+    def private_ip(self) -> Optional[str]:
+        # known once the VSI is created or looked up; None (not cached) until the VPC assigns it, without blocking on the API
+        private_ip = self.vsi.private_ip
+        return private_ip if private_ip and private_ip != "0.0.0.0" else None
 
     @ignore_lru_cache()
     def instance_class(self) -> str:
@@ -73,6 +75,7 @@ class IBMCloudServer(Server):
 
     def terminate_instance_impl(self):
         self.vsi.delete()
+        self.vpc_backend.forget_worker(self.vsi)
 
     def get_ssh_client_impl(self):
         return self.vsi.get_ssh_client()
@@ -1,10 +1,11 @@
+from cryptography.hazmat.primitives.asymmetric import ec
 from OpenSSL import crypto
 
 
 # Based on https://stackoverflow.com/questions/27164354/create-a-self-signed-x509-certificate-in-python
 def generate_self_signed_certificate(output_cert_file, output_key_file):
-    k = crypto.PKey()
-    k.generate_key(crypto.TYPE_RSA, 4096)
+    # P-256 keygen and ECDHE-ECDSA handshakes are far cheaper than RSA 4096 (peers don't verify the cert anyway)
+    k = crypto.PKey.from_cryptography_key(ec.generate_private_key(ec.SECP256R1()))
 
     cert = crypto.X509()
     cert.get_subject().CN = "skyplane"
@@ -13,7 +14,7 @@ def generate_self_signed_certificate(output_cert_file, output_key_file):
     cert.gmtime_adj_notAfter(30 * 24 * 60 * 60)  # valid for 30 days
     cert.set_issuer(cert.get_subject())
     cert.set_pubkey(k)
-    cert.sign(k, "sha512")
+    cert.sign(k, "sha256")
     with open(output_cert_file, "wt") as f:
         f.write(crypto.dump_certificate(crypto.FILETYPE_PEM, cert).decode("utf-8"))
     with open(output_key_file, "wt") as f:
@@ -40,6 +40,9 @@ class GatewayDaemon:
         use_tls=True,
         use_e2ee=True,  # TODO: read from operator field
         use_compression=True,  # TODO: read from operator field
+        use_direct_io=False,
+        use_ktls=False,
+        use_nic_affinity=False,
     ):
         # read gateway program
         gateway_program_path = Path(os.environ["GATEWAY_PROGRAM_FILE"]).expanduser()
@@ -92,6 +95,9 @@ class GatewayDaemon:
             use_tls=self.use_tls,
             use_compression=use_compression,
             e2ee_key_bytes=self.e2ee_key_bytes,
+            use_direct_io=use_direct_io,
+            use_ktls=use_ktls,
+            use_nic_affinity=use_nic_affinity,
         )
 
         # API server
@@ -348,6 +354,9 @@ if __name__ == "__main__":
     parser.add_argument("--disable-tls", action="store_true")
     parser.add_argument("--use-compression", action="store_true")  # TODO: remove
     parser.add_argument("--disable-e2ee", action="store_true")  # TODO: remove
+    parser.add_argument("--use-direct-io", action="store_true", help="Write received chunks with O_DIRECT")
+    parser.add_argument("--use-ktls", action="store_true", help="Decrypt received TLS records in the kernel when supported")
+    parser.add_argument("--pin-to-nic-node", action="store_true", help="Pin receiver workers to the CPUs on their NIC's NUMA node")
     args = parser.parse_args()
 
     os.makedirs(args.chunk_dir)
@@ -355,5 +364,8 @@ if __name__ == "__main__":
         region=args.region,
         chunk_dir=args.chunk_dir,
         use_tls=not args.disable_tls,
+        use_direct_io=args.use_direct_io,
+        use_ktls=args.use_ktls,
+        use_nic_affinity=args.pin_to_nic_node,
     )
     daemon.run()
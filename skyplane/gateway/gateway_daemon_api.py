@@ -293,10 +293,7 @@ class GatewayDaemonAPI(threading.Thread):
         # list chunk status log
         @app.route("/api/v1/chunk_status_log", methods=["GET"])
         def get_chunk_status_log():
-            n_entries = len(self.chunk_status_log)
-            status_log_copy = []  # copy to support concurrent access
-            for i in range(n_entries):
-                status_log_copy.append(self.chunk_status_log[i])
+            status_log_copy = self.chunk_status_log[:]  # copy to support concurrent access, slicing is atomic under the GIL
             return jsonify({"chunk_status_log": status_log_copy})
 
         # post the upload ids mapping
@@ -330,18 +327,14 @@ class GatewayDaemonAPI(threading.Thread):
         @app.route("/api/v1/profile/socket/receiver", methods=["GET"])
         def get_receiver_socket_profiles():
             with self.receiver_socket_profiles_lock:
-                while True:
-                    try:
-                        elem = self.gateway_receiver.socket_profiler_event_queue.get_nowait()
-                        self.receiver_socket_profiles.append(elem)
-                    except Empty:
-                        break
+                self.receiver_socket_profiles.extend(self.gateway_receiver.socket_profiler_events.get_all())
                 return jsonify({"socket_profiles": self.receiver_socket_profiles})
 
         @app.route("/api/v1/profile/compression", methods=["GET"])
         def get_receiver_compression_profile():
             total_size_compressed_bytes, total_size_uncompressed_bytes = 0, 0
-            for _, (compressed_size, uncompressed_size) in self.sender_compressed_sizes.items():
+            # snapshot first: pull_chunk_status_queue may insert while we sum, which would break iterating the live dict
+            for compressed_size, uncompressed_size in list(self.sender_compressed_sizes.values()):
                 total_size_compressed_bytes += compressed_size
                 total_size_uncompressed_bytes += uncompressed_size
             return jsonify(
@@ -1,4 +1,7 @@
-from multiprocessing import Queue
+import ctypes
+import struct
+from multiprocessing import Queue, RawArray, RawValue, Value
+from typing import Dict, List, Optional
 
 
 class GatewayQueue:
@@ -59,3 +62,38 @@ class GatewayANDQueue(GatewayQueue):
 
     def get_nowait(self, requester_handle):
         return self.q[requester_handle].get_nowait()
+
+
+class SocketProfilerRing:
+    """Fixed-size ring of socket profiler events in shared memory.
+
+    Receiver processes pack each event into the next slot instead of pickling a dict through a multiprocessing.Queue. Once the
+    ring is full, the oldest unread events are overwritten.
+    """
+
+    record = struct.Struct("<i16sdQ")  # receiver_id, chunk_id (uuid bytes), time_ms, bytes
+
+    def __init__(self, capacity=2**16):
+        self.capacity = capacity
+        self.buf = RawArray(ctypes.c_char, capacity * self.record.size)
+        self.head = Value(ctypes.c_uint64, 0)  # number of events written; its lock serializes writers and the reader
+        self.tail = RawValue(ctypes.c_uint64, 0)  # number of events consumed
+
+    def put(self, receiver_id: Optional[int], chunk_id: str, time_ms: float, nbytes: int):
+        with self.head.get_lock():
+            idx = self.head.value
+            offset = (idx % self.capacity) * self.record.size
+            self.record.pack_into(self.buf, offset, -1 if receiver_id is None else receiver_id, bytes.fromhex(chunk_id), time_ms, nbytes)
+            self.head.value = idx + 1
+
+    def get_all(self) -> List[Dict]:
+        """Consume all events written since the last call."""
+        with self.head.get_lock():
+            head = self.head.value
+            tail = max(self.tail.value, head - self.capacity)
+            records = [self.record.unpack_from(self.buf, (i % self.capacity) * self.record.size) for i in range(tail, head)]
+            self.tail.value = head
+        return [
+            dict(receiver_id=receiver_id, chunk_id=chunk_id.hex(), time_ms=time_ms, bytes=nbytes)
+            for receiver_id, chunk_id, time_ms, nbytes in records
+        ]
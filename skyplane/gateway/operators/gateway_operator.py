@@ -323,12 +323,21 @@ class GatewaySender(GatewayOperator):
             chunk = chunk_req.chunk
             chunk_file_path = self.chunk_store.get_chunk_file_path(chunk_id)
 
-            # read data from disk (and optionally compress if sending from source region)
-            with open(chunk_file_path, "rb") as f:
-                data = f.read()
-            assert len(data) == chunk.chunk_length_bytes, f"chunk {chunk_id} has size {len(data)} but should be {chunk.chunk_length_bytes}"
+            # plaintext hops that don't re-encode the chunk (e.g. relays) let the kernel copy it from the chunk file to the socket
+            # with sendfile(2) instead of reading it into memory first
+            use_sendfile = self.ssl_context is None and not self.use_compression and self.e2ee_secretbox is None
 
-            wire_length = len(data)
+            # read data from disk (and optionally compress if sending from source region)
+            if use_sendfile:
+                data = None
+                data_len = os.path.getsize(chunk_file_path)
+            else:
+                with open(chunk_file_path, "rb") as f:
+                    data = f.read()
+                data_len = len(data)
+            assert data_len == chunk.chunk_length_bytes, f"chunk {chunk_id} has size {data_len} but should be {chunk.chunk_length_bytes}"
+
+            wire_length = data_len
             raw_wire_length = wire_length
             compressed_length = None
 
@@ -356,7 +365,11 @@ class GatewaySender(GatewayOperator):
             # file_size = os.path.getsize(chunk_file_path)
 
             with Timer() as t:
-                sock.sendall(data)
+                if use_sendfile:
+                    with open(chunk_file_path, "rb") as f:
+                        sock.sendfile(f, count=wire_length)
+                else:
+                    sock.sendall(data)
 
             # logger.debug(f"[sender:{self.worker_id}]:{chunk_id} sent at {chunk.chunk_length_bytes * 8 / t.elapsed / MB:.2f}Mbps")
             print(f"[sender:{self.worker_id}]:{chunk_id} sent at {wire_length * 8 / t.elapsed / MB:.2f}Mbps")
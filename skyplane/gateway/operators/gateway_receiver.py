@@ -1,13 +1,20 @@
+import ctypes
+import fcntl
+import mmap
 import os
+import queue
 import signal
 import socket
 import ssl
-import time
+import struct
+import tempfile
 import lz4.frame
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import closing
+from functools import partial
 from multiprocessing import Event, Process, Value, Queue
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import nacl.secret
 
@@ -18,6 +25,65 @@ from skyplane.utils.timer import Timer
 from skyplane.chunk import WireProtocolHeader
 from skyplane.gateway.cert import generate_self_signed_certificate
 from skyplane.gateway.chunk_store import ChunkStore
+from skyplane.gateway.gateway_queue import SocketProfilerRing
+
+# kTLS socket options from linux/tls.h
+SOL_TLS = 282
+TLS_RX = 2
+
+# O_DIRECT requires the buffer address, file offset and length to be multiples of the logical block size
+DIRECT_IO_ALIGNMENT = 4096
+
+# fallocate(2) mode that reserves blocks without changing the file size (linux/falloc.h)
+FALLOC_FL_KEEP_SIZE = 0x01
+_libc_fallocate = getattr(ctypes.CDLL(None, use_errno=True), "fallocate", None)
+if _libc_fallocate is not None:
+    _libc_fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong]
+
+
+def _fallocate_keep_size(fd: int, length: int):
+    """Reserve length bytes of disk for fd up front, so writes don't extend extents piecemeal. Unlike os.posix_fallocate this keeps the
+    file size at 0, since GatewayWaitReceiver treats the file size as download progress. Best effort: a no-op where unsupported."""
+    if _libc_fallocate is not None and length > 0:
+        _libc_fallocate(fd, FALLOC_FL_KEEP_SIZE, 0, length)  # failures (e.g. EOPNOTSUPP) just skip preallocation
+
+
+# ioctl returning an interface's IPv4 address (linux/sockios.h)
+SIOCGIFADDR = 0x8915
+
+
+def _iface_for_address(local_ip: str) -> Optional[str]:
+    """Name of the interface that owns local_ip, or None if no interface matches."""
+    with closing(socket.socket(socket.AF_INET, socket.SOCK_DGRAM)) as s:
+        for _, iface in socket.if_nameindex():
+            try:
+                ifreq = fcntl.ioctl(s.fileno(), SIOCGIFADDR, struct.pack("256s", iface.encode()[:15]))
+            except OSError:
+                continue  # no IPv4 address
+            if socket.inet_ntoa(ifreq[20:24]) == local_ip:
+                return iface
+    return None
+
+
+def _nic_local_cpus(local_ip: str) -> Optional[List[int]]:
+    """CPUs on the NUMA node of the NIC that owns local_ip, or None if the topology can't be read (e.g. not Linux, a virtual
+    interface, or no NUMA info)."""
+    try:
+        iface = _iface_for_address(local_ip)
+        if iface is None:
+            return None
+        with open(f"/sys/class/net/{iface}/device/numa_node") as f:
+            node = int(f.read())
+        if node < 0:
+            return None  # single node machine or the firmware doesn't report locality
+        with open(f"/sys/devices/system/node/node{node}/cpulist") as f:
+            cpus = []
+            for part in f.read().strip().split(","):
+                lo, _, hi = part.partition("-")
+                cpus.extend(range(int(lo), int(hi or lo) + 1))
+        return cpus
+    except (OSError, ValueError):
+        return None
 
 
 class GatewayReceiver:
@@ -33,6 +99,11 @@ class GatewayReceiver:
         use_tls: Optional[bool] = True,
         use_compression: Optional[bool] = True,
         e2ee_key_bytes: Optional[bytes] = None,
+        use_direct_io: bool = False,
+        use_ktls: bool = False,
+        use_nic_affinity: bool = False,
+        socket_buffer_size: int = 64 * MB,
+        decode_pipeline_depth: int = 2,
     ):
         self.handle = handle
         self.region = region
@@ -40,6 +111,8 @@ class GatewayReceiver:
         self.error_event = error_event
         self.error_queue = error_queue
         self.recv_block_size = recv_block_size
+        self.socket_buffer_size = socket_buffer_size
+        self.decode_pipeline_depth = decode_pipeline_depth
         self.max_pending_chunks = max_pending_chunks
         print("Max pending chunks", self.max_pending_chunks)
         self.use_compression = use_compression
@@ -50,21 +123,54 @@ class GatewayReceiver:
         self.server_processes = []
         self.server_ports = []
         self.next_gateway_worker_id = 0
-        self.socket_profiler_event_queue = Queue()
+        self.socket_profiler_events = SocketProfilerRing()
+
+        # write uncompressed, unencrypted chunks with O_DIRECT to keep them out of the page cache
+        self.use_direct_io = use_direct_io and hasattr(os, "O_DIRECT")
+        if self.use_direct_io:
+            assert recv_block_size % DIRECT_IO_ALIGNMENT == 0, f"recv_block_size must be a multiple of {DIRECT_IO_ALIGNMENT} for O_DIRECT"
 
-        # SSL context
+        # SSL context (shared by all server workers, which inherit it on fork)
         if use_tls:
-            generate_self_signed_certificate("temp.cert", "temp.key")
             self.ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
             self.ssl_context.check_hostname = False
             self.ssl_context.verify_mode = ssl.CERT_NONE
-            self.ssl_context.load_cert_chain("temp.cert", "temp.key")
+            # unique files per receiver so concurrent gateways don't race on a shared temp.cert/temp.key
+            cert_fd, cert_path = tempfile.mkstemp(prefix="skyplane-", suffix=".cert")
+            key_fd, key_path = tempfile.mkstemp(prefix="skyplane-", suffix=".key")
+            os.close(cert_fd)
+            os.close(key_fd)
+            try:
+                generate_self_signed_certificate(cert_path, key_path)
+                self.ssl_context.load_cert_chain(cert_path, key_path)
+            finally:
+                os.remove(cert_path)
+                os.remove(key_path)
+            # TLS 1.3 only offers AEAD suites; honor the server's (AES-GCM first) ordering so AES-NI is used over ChaCha20
+            self.ssl_context.minimum_version = ssl.TLSVersion.TLSv1_3
+            self.ssl_context.options |= ssl.OP_CIPHER_SERVER_PREFERENCE
+            if use_ktls and ssl.OPENSSL_VERSION_INFO >= (3,):
+                self.ssl_context.options |= 1 << 3  # SSL_OP_ENABLE_KTLS, for interpreters that predate the constant
+                if ssl.OPENSSL_VERSION_INFO < (3, 2):
+                    # OpenSSL before 3.2 only installs kTLS receive state for TLS 1.2, so pin 1.2 (still ECDHE + AES-GCM first)
+                    logger.warning(f"{ssl.OPENSSL_VERSION} only supports kTLS receive for TLS 1.2, using TLS 1.2 for kTLS")
+                    self.ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+                    self.ssl_context.maximum_version = ssl.TLSVersion.TLSv1_2
             logger.info(f"Using {str(ssl.OPENSSL_VERSION)}")
         else:
             self.ssl_context = None
+        self.use_ktls = use_ktls and self.ssl_context is not None
+        self.use_nic_affinity = use_nic_affinity
 
         # private state per worker
         self.worker_id: Optional[int] = None
+        self._recv_buf: Optional[Union[bytearray, mmap.mmap]] = None
+        self._recv_view: Optional[memoryview] = None
+        self._splice_pipe: Optional[Tuple[int, int, int]] = None
+        self._ktls_rx = False
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        self._free_recv_slots: Optional[queue.Queue] = None
+        self._pending_decodes: List[Future] = []
 
     def start_server(self):
         started_event = Event()
@@ -83,6 +189,7 @@ class GatewayReceiver:
 
                 signal.signal(signal.SIGINT, signal_handler)
 
+                self._set_recv_buffer_size(sock)  # before listen() so the window scale is negotiated for the full buffer
                 sock.listen()
                 if self.ssl_context is not None:
                     ssl_sock = self.ssl_context.wrap_socket(sock, server_side=True)
@@ -92,6 +199,12 @@ class GatewayReceiver:
                 logger.info(f"[receiver:{socket_port}] Waiting for connection")
                 ssl_conn, addr = ssl_sock.accept()
                 logger.info(f"[receiver:{socket_port}] Accepted connection from {addr}")
+                ssl_conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                if self.use_nic_affinity:
+                    self._pin_to_nic_node(ssl_conn.getsockname()[0])
+                if self.use_ktls:
+                    self._ktls_rx = self._ktls_rx_enabled(ssl_conn)
+                    logger.info(f"[receiver:{socket_port}] kTLS receive offload {'enabled' if self._ktls_rx else 'unavailable'}")
                 while not exit_flag.is_set() and not self.error_event.is_set():
                     try:
                         self.recv_chunks(ssl_conn, addr)
@@ -100,6 +213,12 @@ class GatewayReceiver:
                         self.error_queue.put(traceback.format_exc())
                         exit_flag.set()
                         self.error_event.set()
+                try:
+                    self._reap_decodes(wait=True)
+                except Exception as e:
+                    logger.warning(f"[receiver:{socket_port}] Error: {str(e)}")
+                    self.error_queue.put(traceback.format_exc())
+                    self.error_event.set()
                 logger.warning(f"[receiver:{socket_port}] Exiting on signal")
                 ssl_conn.close()
 
@@ -139,11 +258,213 @@ class GatewayReceiver:
     def stop_workers(self):
         self.stop_servers()
 
+    @staticmethod
+    def _pin_to_nic_node(local_ip: str):
+        """Restrict this worker to the CPUs on the NUMA node of the NIC the connection arrived on, so received data isn't copied across
+        sockets. Workers keep the whole node rather than a single core so their decode/write threads still run in parallel."""
+        cpus = _nic_local_cpus(local_ip)
+        if not cpus or not hasattr(os, "sched_setaffinity"):
+            return
+        allowed = sorted(set(cpus) & os.sched_getaffinity(0))
+        if not allowed:
+            return
+        try:
+            os.sched_setaffinity(0, allowed)
+        except OSError as e:
+            logger.warning(f"[receiver] Failed to pin to NIC-local CPUs {allowed}: {e}")
+
+    def _get_recv_view(self, nbytes: int) -> memoryview:
+        """Return a view over the worker's reusable receive buffer, growing it if it is smaller than nbytes."""
+        if self._recv_buf is None or len(self._recv_buf) < nbytes:
+            size = max(nbytes, self.recv_block_size)
+            # anonymous mmaps are page aligned, as O_DIRECT requires
+            self._recv_buf = mmap.mmap(-1, size) if self.use_direct_io else bytearray(size)
+            self._recv_view = memoryview(self._recv_buf)
+        return self._recv_view[:nbytes]
+
+    def _set_recv_buffer_size(self, sock: socket.socket):
+        """Size the TCP receive buffer for high bandwidth-delay WAN flows. An explicit SO_RCVBUF disables receive autotuning and is
+        silently capped at net.core.rmem_max, so it is only set when the kernel will honor the full size."""
+        try:
+            with open("/proc/sys/net/core/rmem_max") as f:
+                rmem_max = int(f.read())
+        except (OSError, ValueError):
+            rmem_max = 0
+        if rmem_max >= self.socket_buffer_size:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.socket_buffer_size)
+        else:
+            logger.debug(f"[receiver] net.core.rmem_max={rmem_max} < {self.socket_buffer_size}, keeping receive buffer autotuning")
+
+    @staticmethod
+    def _ktls_rx_enabled(conn: socket.socket) -> bool:
+        """Check whether OpenSSL installed kernel TLS receive state on the socket (getsockopt fails if it did not)."""
+        try:
+            conn.getsockopt(SOL_TLS, TLS_RX, 64)
+            return True
+        except OSError:
+            return False
+
+    def _recv_exact(self, conn: socket.socket, view: memoryview) -> int:
+        """Fill view from conn and return the number of bytes received. Plaintext sockets let the kernel fill it in a single MSG_WAITALL call, while SSL sockets reject
+        recv flags and loop over TLS records instead. The loop also covers MSG_WAITALL returning early when interrupted by a signal."""
+        rest = view
+        if self.ssl_context is None:
+            recv_into, flags = conn.recv_into, socket.MSG_WAITALL
+        elif self._ktls_rx:
+            # the kernel decrypts records, so once the plaintext OpenSSL already buffered is drained, read the fd directly
+            while rest and conn.pending() > 0:
+                rest = rest[conn.recv_into(rest, min(len(rest), conn.pending())) :]
+            recv_into, flags = partial(socket.socket.recv_into, conn), socket.MSG_WAITALL
+        else:
+            recv_into, flags = conn.recv_into, 0
+        while rest:
+            nbytes = recv_into(rest, len(rest), flags)
+            if nbytes == 0:
+                raise ConnectionError(f"Socket closed after receiving {len(view) - len(rest)} of {len(view)} bytes")
+            if nbytes == len(rest):
+                return len(view)  # the common MSG_WAITALL case: filled in one call, so no need to slice out an empty remainder
+            rest = rest[nbytes:]
+        return len(view) - len(rest)
+
+    def _write_all(self, fd: int, data):
+        """Write data to a raw file descriptor, bypassing Python's buffered file layer. os.write may return short on regular files."""
+        view = memoryview(data)
+        while len(view) > 0:
+            view = view[os.write(fd, view) :]
+
+    def _get_splice_pipe(self) -> Tuple[int, int, int]:
+        """Return the worker's (read fd, write fd, capacity) pipe used to splice socket data into chunk files."""
+        if self._splice_pipe is None:
+            pipe_r, pipe_w = os.pipe2(os.O_CLOEXEC)
+            try:
+                fcntl.fcntl(pipe_w, fcntl.F_SETPIPE_SZ, self.recv_block_size)
+            except OSError:  # capped by /proc/sys/fs/pipe-max-size
+                pass
+            self._splice_pipe = (pipe_r, pipe_w, fcntl.fcntl(pipe_w, fcntl.F_GETPIPE_SZ))
+        return self._splice_pipe
+
+    def _splice_to_fd(self, conn: socket.socket, fd: int, nbytes: int) -> int:
+        """Move nbytes from a plaintext socket into fd with splice(2) via a pipe, so the data never passes through userspace. Returns
+        the number of bytes moved."""
+        pipe_r, pipe_w, pipe_size = self._get_splice_pipe()
+        sock_fd = conn.fileno()
+        remaining = nbytes
+        while remaining > 0:
+            moved = os.splice(sock_fd, pipe_w, min(remaining, pipe_size), flags=os.SPLICE_F_MOVE | os.SPLICE_F_MORE)
+            if moved == 0:
+                raise ConnectionError(f"Socket closed after receiving {nbytes - remaining} of {nbytes} bytes")
+            remaining -= moved
+            while moved > 0:
+                moved -= os.splice(pipe_r, fd, moved, flags=os.SPLICE_F_MOVE)
+        return nbytes - remaining
+
+    def _get_io_executor(self) -> ThreadPoolExecutor:
+        """Return the worker's I/O thread, which decodes and writes chunks off the socket thread in submission order."""
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"receiver-{self.worker_id}-io")
+        return self._io_executor
+
+    def _write_block(self, fd: int, block: memoryview, clear_direct_io: bool):
+        """Write one streamed block. For the final unaligned block under O_DIRECT, write the aligned prefix directly, then clear
+        O_DIRECT for the tail."""
+        if clear_direct_io:
+            aligned_len = len(block) - len(block) % DIRECT_IO_ALIGNMENT
+            self._write_all(fd, block[:aligned_len])
+            fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) & ~os.O_DIRECT)
+            self._write_all(fd, block[aligned_len:])
+        else:
+            self._write_all(fd, block)
+
+    def _recv_to_fd(self, conn: socket.socket, fd: int, nbytes: int, direct_io: bool) -> int:
+        """Stream nbytes from conn into fd one recv_block_size block at a time and return the number of bytes received. Blocks
+        alternate between two halves of the receive buffer so that each block is written on the I/O thread while the next one is
+        received."""
+        block_size = self.recv_block_size
+        view = self._get_recv_view(2 * block_size)
+        halves = (view[:block_size], view[block_size:])
+        executor, recv_exact = self._get_io_executor(), self._recv_exact
+        pending_write: Optional[Future] = None
+        remaining, idx = nbytes, 0
+        try:
+            while remaining > 0:
+                block = halves[idx % 2] if remaining >= block_size else halves[idx % 2][:remaining]  # only the tail needs a new view
+                received = recv_exact(conn, block)
+                if pending_write is not None:
+                    pending_write.result()  # the previous block's half is free again once its write completes
+                pending_write = executor.submit(self._write_block, fd, block, direct_io and len(block) % DIRECT_IO_ALIGNMENT != 0)
+                remaining -= received
+                idx += 1
+        finally:
+            if pending_write is not None:
+                pending_write.result()
+        return nbytes - remaining
+
+    def _acquire_recv_slot(self, nbytes: int) -> bytearray:
+        """Take a receive buffer from the decode pipeline's pool, blocking while all of them are still being decoded."""
+        if self._free_recv_slots is None:
+            self._free_recv_slots = queue.Queue()
+            for _ in range(self.decode_pipeline_depth):
+                self._free_recv_slots.put(bytearray(0))
+        slot = self._free_recv_slots.get()
+        return slot if len(slot) >= nbytes else bytearray(nbytes)
+
+    def _decode_and_write(self, fpath, slot: bytearray, chunk_header: WireProtocolHeader, should_decrypt: bool, should_decompress: bool):
+        """Decrypt and/or decompress a received chunk and write it to disk. Runs on the I/O thread; pynacl and lz4 release
+        the GIL, so this overlaps with receiving the next chunk."""
+        try:
+            to_write = memoryview(slot)[: chunk_header.data_len]
+
+            if should_decrypt:
+                to_write = self.e2ee_secretbox.decrypt(bytes(to_write))
+                print(f"[receiver:{self.worker_id}]:{chunk_header.chunk_id} Decrypting {len(to_write)} bytes")
+
+            if should_decompress:
+                to_write = lz4.frame.decompress(to_write)
+                print(f"[receiver:{self.worker_id}]:{chunk_header.chunk_id} Decompressed to {len(to_write)} bytes")
+
+            assert (
+                len(to_write) == chunk_header.raw_data_len
+            ), f"Decoded chunk {chunk_header.chunk_id} has {len(to_write)} bytes, expected {chunk_header.raw_data_len}"
+            fd, _ = self._open_chunk_file(fpath, False, len(to_write))
+            try:
+                self._write_all(fd, to_write)
+            finally:
+                os.close(fd)
+        finally:
+            self._free_recv_slots.put(slot)
+
+    def _reap_decodes(self, wait: bool = False):
+        """Re-raise errors from finished decode jobs, or from all in-flight jobs when wait is set."""
+        pending = []
+        for i, fut in enumerate(self._pending_decodes):
+            if wait or fut.done():
+                try:
+                    fut.result()
+                except BaseException:
+                    self._pending_decodes = pending + self._pending_decodes[i + 1 :]  # report each failed job only once
+                    raise
+            else:
+                pending.append(fut)
+        self._pending_decodes = pending
+
+    def _open_chunk_file(self, fpath, direct_io: bool, size: int) -> Tuple[int, bool]:
+        """Open a chunk file for writing with size bytes preallocated, returning the fd and whether O_DIRECT is in effect."""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        fd = None
+        if direct_io:
+            try:
+                fd = os.open(fpath, flags | os.O_DIRECT, 0o644)
+            except OSError as e:  # e.g. tmpfs does not support O_DIRECT
+                logger.warning(f"[receiver:{self.worker_id}] O_DIRECT unsupported for {fpath} ({e}), falling back to buffered writes")
+                self.use_direct_io = direct_io = False
+        if fd is None:
+            fd = os.open(fpath, flags, 0o644)
+        _fallocate_keep_size(fd, size)
+        return fd, direct_io
+
     def recv_chunks(self, conn: socket.socket, addr: Tuple[str, int]):
         server_port = conn.getsockname()[1]
         chunks_received = []
-        init_space = self.chunk_store.remaining_bytes()
-        print("Init space", init_space)
         while True:
             # receive header and write data to file
             logger.debug(f"[receiver:{server_port}] Blocking for next header")
@@ -169,62 +490,32 @@ class GatewayReceiver:
             logger.debug(f"[receiver:{server_port}]:{chunk_header.chunk_id} wire header length {chunk_header.data_len}")
             with Timer() as t:
                 fpath = self.chunk_store.get_chunk_file_path(chunk_header.chunk_id)
-                with fpath.open("wb") as f:
-                    socket_data_len = chunk_header.data_len
-                    chunk_received_size, chunk_received_size_decompressed = 0, 0
-                    to_write = bytearray(socket_data_len)
-                    to_write_view = memoryview(to_write)
-                    while socket_data_len > 0:
-                        nbytes = conn.recv_into(to_write_view[chunk_received_size:], min(socket_data_len, self.recv_block_size))
-                        socket_data_len -= nbytes
-                        chunk_received_size += nbytes
-                        self.socket_profiler_event_queue.put(
-                            dict(
-                                receiver_id=self.worker_id,
-                                chunk_id=chunk_header.chunk_id,
-                                time_ms=t.elapsed * 1000.0,
-                                bytes=chunk_received_size,
-                            )
-                        )
-                    to_write = bytes(to_write)
-
-                    if should_decrypt:
-                        to_write = self.e2ee_secretbox.decrypt(to_write)
-                        print(f"[receiver:{server_port}]:{chunk_header.chunk_id} Decrypting {len(to_write)} bytes")
-
-                    if should_decompress:
-                        data_batch_decompressed = lz4.frame.decompress(to_write)
-                        chunk_received_size_decompressed += len(data_batch_decompressed)
-                        to_write = data_batch_decompressed
-                        print(
-                            f"[receiver:{server_port}]:{chunk_header.chunk_id} Decompressing {len(to_write)} bytes to {chunk_received_size_decompressed} bytes"
-                        )
-
-                    # try to write data until successful
-                    while True:
-                        try:
-                            f.seek(0, 0)
-                            f.write(to_write)
-                            f.flush()
-
-                            # check write succeeds
-                            assert os.path.exists(fpath)
-
-                            # check size
-                            file_size = os.path.getsize(fpath)
-                            if file_size == chunk_header.raw_data_len:
-                                break
-                            elif file_size >= chunk_header.raw_data_len:
-                                raise ValueError(f"[Gateway] File size {file_size} greater than chunk size {chunk_header.raw_data_len}")
-                        except Exception as e:
-                            print(e)
-                        print(
-                            f"[receiver:{server_port}]: No remaining space with bytes {self.chunk_store.remaining_bytes()} data len {chunk_header.data_len} max pending {self.max_pending_chunks}, total space {init_space}"
-                        )
-                        time.sleep(1)
+                socket_data_len = chunk_header.data_len
+                if should_decrypt or should_decompress:
+                    # decoding needs the whole chunk in memory: receive into a pooled slot and hand decoding and the file write to
+                    # the I/O thread, so the next chunk is received while this one is decoded
+                    slot = self._acquire_recv_slot(socket_data_len)
+                    chunk_received_size = self._recv_exact(conn, memoryview(slot)[:socket_data_len])
+                    self._pending_decodes.append(
+                        self._get_io_executor().submit(self._decode_and_write, fpath, slot, chunk_header, should_decrypt, should_decompress)
+                    )
+                else:
+                    # otherwise stream straight to disk
+                    fd, direct_io = self._open_chunk_file(fpath, self.use_direct_io, socket_data_len)
+                    # splice(2) (Python 3.10+ on Linux) moves plaintext data socket -> pipe -> file without a userspace copy
+                    use_splice = self.ssl_context is None and not direct_io and hasattr(os, "splice")
+                    try:
+                        if use_splice:
+                            chunk_received_size = self._splice_to_fd(conn, fd, socket_data_len)
+                        else:
+                            chunk_received_size = self._recv_to_fd(conn, fd, socket_data_len, direct_io)
+                    finally:
+                        os.close(fd)
+                self.socket_profiler_events.put(self.worker_id, chunk_header.chunk_id, t.elapsed * 1000.0, chunk_received_size)
+            self._reap_decodes()
             assert (
-                socket_data_len == 0 and chunk_received_size == chunk_header.data_len
-            ), f"Size mismatch: got {chunk_received_size} expected {chunk_header.data_len} and had {socket_data_len} bytes remaining"
+                chunk_received_size == chunk_header.data_len
+            ), f"Size mismatch: got {chunk_received_size} expected {chunk_header.data_len}"
 
             logger.debug(f"Recieved chunk {chunk_header.chunk_id} size {chunk_header.data_len}")
 
@@ -234,4 +525,6 @@ class GatewayReceiver:
 
             if chunk_header.n_chunks_left_on_socket == 0:
                 logger.debug(f"[receiver:{server_port}] End of stream reached")
+                # the sender keeps the connection open, so surface decode errors for this stream now rather than at worker exit
+                self._reap_decodes(wait=True)
                 return
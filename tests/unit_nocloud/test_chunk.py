@@ -0,0 +1,27 @@
+import pytest
+
+from skyplane.chunk import WireProtocolHeader
+
+
+def test_wire_protocol_header_roundtrip():
+    header = WireProtocolHeader(
+        chunk_id="0123456789abcdef0123456789abcdef",
+        data_len=123456789,
+        raw_data_len=987654321,
+        is_compressed=True,
+        n_chunks_left_on_socket=7,
+    )
+    header_bytes = header.to_bytes()
+    assert len(header_bytes) == WireProtocolHeader.length_bytes() == 53
+    # layout is part of the wire protocol, so pin it: magic, version, chunk_id, data_len, raw_data_len, is_compressed, n_chunks_left
+    assert header_bytes.hex() == (
+        "534b595f4c41524b" "00000003" "0123456789abcdef0123456789abcdef" "00000000075bcd15" "000000003ade68b1" "01" "0000000000000007"
+    )
+    assert WireProtocolHeader.from_bytes(header_bytes) == header
+
+
+def test_wire_protocol_header_bad_magic():
+    header_bytes = bytearray(WireProtocolHeader("00" * 16, 1, 1, False, 0).to_bytes())
+    header_bytes[0] ^= 0xFF
+    with pytest.raises(ValueError):
+        WireProtocolHeader.from_bytes(bytes(header_bytes))
@@ -0,0 +1,23 @@
+from skyplane.gateway.gateway_queue import SocketProfilerRing
+
+
+def test_socket_profiler_ring_roundtrip():
+    ring = SocketProfilerRing(capacity=4)
+    ring.put(3, "0123456789abcdef0123456789abcdef", 12.5, 4096)
+    ring.put(None, "ff" * 16, 0.25, 1)
+    assert ring.get_all() == [
+        dict(receiver_id=3, chunk_id="0123456789abcdef0123456789abcdef", time_ms=12.5, bytes=4096),
+        dict(receiver_id=-1, chunk_id="ff" * 16, time_ms=0.25, bytes=1),
+    ]
+    # events are consumed by the first read
+    assert ring.get_all() == []
+
+
+def test_socket_profiler_ring_overwrites_oldest():
+    ring = SocketProfilerRing(capacity=4)
+    for i in range(6):
+        ring.put(i, f"{i:032x}", float(i), i)
+    events = ring.get_all()
+    assert [e["receiver_id"] for e in events] == [2, 3, 4, 5]
+    assert [e["chunk_id"] for e in events] == [f"{i:032x}" for i in range(2, 6)]
+    assert ring.get_all() == []